@@ -3,9 +3,52 @@ import matplotlib.pyplot as plt
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.lines import Line2D
+import concurrent.futures
+import functools
 import os
-import csv
 import numpy as np
+import orjson
+import pyarrow as pa
+from pyarrow import csv as pacsv
+
+# Name der Ratenspalte aus den Originaldaten; einmal gebunden, damit die
+# lange Zeichenkette nicht überall wiederholt wird.
+RATE_COL = "Combined total net enrolment rate, primary, both sexes"
+
+# Spalten, die von allen Diagrammen benötigt werden, samt kompakter Datentypen.
+# Kategorische Spalten beschleunigen groupby/unique/Filterungen erheblich,
+# schmale numerische Typen halbieren den Speicherbedarf.
+REQUIRED_COLS = ('Entity', 'Continent', 'Year', RATE_COL)
+
+DTYPES = {
+    'Entity': 'category',
+    'Continent': 'category',
+    'Year': 'int16',
+    RATE_COL: 'float32',
+}
+
+
+@functools.lru_cache(maxsize=64)
+def _tab10(n):
+    """
+    Liefert n Farben aus der tab10-Colormap, pro Anzahl gecacht.
+
+    Args:
+        n: Anzahl der benötigten Farben
+    """
+    return plt.cm.tab10(np.linspace(0, 1, max(n, 1)))
+
+
+@functools.lru_cache(maxsize=64)
+def _tab20(n):
+    """
+    Liefert n Farben aus der tab20-Colormap, pro Anzahl gecacht.
+
+    Args:
+        n: Anzahl der benötigten Farben
+    """
+    return plt.cm.tab20(np.arange(max(n, 1)))
 
 
 class Diagram:
@@ -27,6 +70,9 @@ class Diagram:
         self.df = None
         self.highlight_country = None
         self.countries_by_continent = {}
+        self.continents = []
+        self._cont_idx = {}
+        self._pending_update = None
 
         self.figure, self.ax = plt.subplots(figsize=(10, 6))
         self.canvas = FigureCanvasTkAgg(self.figure, master=self.parent)
@@ -47,9 +93,33 @@ class Diagram:
         Args:
             df: Der DataFrame mit den zu visualisierenden Daten
         """
+        if df is not None:
+            df = self._downcast(df)
         self.df = df
         self.update()
 
+    @staticmethod
+    def _downcast(df):
+        """
+        Verkleinert die numerischen Spalten auf kompakte Datentypen.
+
+        float32 für die Einschulungsrate und int16 für das Jahr reichen für
+        die Darstellung aus und halbieren die bewegten Datenmengen in allen
+        Aggregationen. Bereits kompakte Spalten bleiben unverändert.
+
+        Args:
+            df: Der DataFrame mit den zu visualisierenden Daten
+        """
+        conversions = {}
+        if df[RATE_COL].dtype != np.float32:
+            conversions[RATE_COL] = df[RATE_COL].astype('float32')
+        if df['Year'].dtype != np.int16:
+            conversions['Year'] = df['Year'].astype('int16')
+
+        if conversions:
+            df = df.assign(**conversions)
+        return df
+
     def show(self):
         """
         Zeigt das Diagramm an.
@@ -67,6 +137,57 @@ class Diagram:
 
         self.show()
 
+    def apply_index(self, continents, countries_by_continent, cont_idx):
+        """
+        Übernimmt die einmalig auf App-Ebene berechneten Filterstrukturen.
+
+        Args:
+            continents: Sortierte Liste der Kontinente
+            countries_by_continent: Abbildung Kontinent -> sortierte Länderliste
+            cont_idx: Abbildung Kontinent -> Zeilenindizes im DataFrame
+        """
+        self.continents = continents
+        self.countries_by_continent = countries_by_continent
+        self._cont_idx = cont_idx
+
+    def filter_state(self):
+        """
+        Liefert den aktuellen Filterzustand als hashbares Tupel.
+
+        Dient als Cache-Schlüssel auf App-Ebene, um Aktualisierungen bei
+        unverändertem Zustand zu überspringen.
+        """
+        return ()
+
+    def _schedule_update(self):
+        """
+        Plant eine entprellte Aktualisierung des Diagramms.
+
+        Mehrere schnell aufeinanderfolgende Aufrufe (z.B. beim Durchblättern
+        einer Combobox mit den Pfeiltasten) werden zu einer einzigen
+        Aktualisierung zusammengefasst.
+        """
+        if self._pending_update is not None:
+            self.parent.after_cancel(self._pending_update)
+        self._pending_update = self.parent.after(80, self._do_update)
+
+    def _do_update(self):
+        """
+        Führt die zuvor geplante Aktualisierung aus.
+        """
+        self._pending_update = None
+        self.update()
+
+    def _batch_ui(self, fn):
+        """
+        Führt UI-Mutationen gesammelt im Idle-Zyklus von Tk aus, damit
+        mehrere Widget-Änderungen nur einen Layoutdurchlauf auslösen.
+
+        Args:
+            fn: Die auszuführende Funktion ohne Argumente
+        """
+        self.parent.after_idle(fn)
+
     def save(self, filepath):
         """
         Speichert das Diagramm als Bilddatei.
@@ -81,11 +202,20 @@ class Diagram:
             original_size = self.figure.get_size_inches()
             self.figure.set_size_inches(12, 8)
 
+            self.canvas.draw()
+
+            save_kwargs = {}
+            if filepath.lower().endswith('.png'):
+                # Schwache zlib-Kompression: deutlich schnelleres Schreiben
+                # bei nur geringfügig größerer Datei.
+                save_kwargs['pil_kwargs'] = {'compress_level': 1}
+
             self.figure.savefig(
                 filepath,
                 dpi=300,
                 bbox_inches='tight',
-                pad_inches=0.5
+                pad_inches=0.5,
+                **save_kwargs
             )
 
             self.figure.set_size_inches(*original_size)
@@ -95,23 +225,62 @@ class Diagram:
             print(f"Fehler beim Speichern des Diagramms: {e}")
             return False
 
-    def set_diagram_background(self, color='#FFFACD'):
+    def set_diagram_background(self, color='#FFFACD', redraw=True):
         """
         Ändert nur die Hintergrundfarbe des Diagramms.
 
         Args:
             color: Hex-Farbcode für den Hintergrund (Standard: Hellgelb)
+            redraw: Ob direkt neu gezeichnet werden soll. In update()-Pfaden,
+                die am Ende ohnehin neu zeichnen, sollte False übergeben
+                werden, um ein doppeltes Rendern zu vermeiden.
         """
         self.figure.patch.set_facecolor(color)
 
-        self.ax.set_facecolor(color)
+        for ax in self.figure.axes:
+            ax.set_facecolor(color)
 
         self.canvas_widget.configure(background=color)
 
-        self.canvas.draw()
+        if redraw:
+            self.canvas.draw_idle()
+
+
+class _ContinentFilterMixin:
+    """
+    Mixin für Diagramme mit Kontinent- und Länder-Comboboxen.
+
+    Befüllt die Comboboxen aus den auf App-Ebene vorberechneten
+    Filterstrukturen, damit nicht jede Diagrammklasse die groupby-Arbeit
+    wiederholt.
+    """
+
+    def apply_index(self, continents, countries_by_continent, cont_idx):
+        """
+        Übernimmt die Filterstrukturen und initialisiert die Comboboxen.
+
+        Args:
+            continents: Sortierte Liste der Kontinente
+            countries_by_continent: Abbildung Kontinent -> sortierte Länderliste
+            cont_idx: Abbildung Kontinent -> Zeilenindizes im DataFrame
+        """
+        super().apply_index(continents, countries_by_continent, cont_idx)
+
+        self.continent_combo.config(values=["Alle"] + continents, state="readonly")
+        self.continent_combo.current(0)
+
+        self.country_combo.config(values=["Alle Länder"] + countries_by_continent["Alle"],
+                                  state="readonly")
+        self.country_combo.current(0)
 
+    def filter_state(self):
+        """
+        Liefert die aktuelle Kontinent-/Länderauswahl als Tupel.
+        """
+        return (self.continent_var.get(), self.country_var.get())
 
-class BarDiagram(Diagram):
+
+class BarDiagram(_ContinentFilterMixin, Diagram):
     """
     Klasse für Balkendiagramme, erbt von der Basisklasse Diagram.
     """
@@ -144,27 +313,36 @@ class BarDiagram(Diagram):
 
         self.highlight_country = None
 
+        self._bars = None
+        self._bar_countries = None
+        self._bar_texts = []
+        self._bg = None
+        self._cont_idx = {}
+        self._sorted_idx = {}
+        self._entity_arr = None
+        self._values_arr = None
+        self._years_arr = None
+        self.canvas.mpl_connect('draw_event', self._on_draw)
+
     def set_data(self, df):
         """
-        Setzt die Daten und initialisiert die Comboboxen.
+        Setzt die Daten und baut die vorsortierten Indexstrukturen auf.
+
+        Erwartet, dass apply_index bereits aufgerufen wurde.
 
         Args:
             df: Der DataFrame mit den zu visualisierenden Daten
         """
+        if df is not None:
+            df = self._downcast(df)
         self.df = df
         if df is not None:
-            continents = sorted(df['Continent'].unique())
-            self.continent_combo.config(values=["Alle"] + continents, state="readonly")
-            self.continent_combo.current(0)
+            self._entity_arr = df['Entity'].to_numpy()
+            self._values_arr = df[RATE_COL].to_numpy()
+            self._years_arr = df['Year'].to_numpy()
 
-            self.countries_by_continent = {"Alle": sorted(df['Entity'].unique())}
-            for continent in continents:
-                countries = sorted(df[df['Continent'] == continent]['Entity'].unique())
-                self.countries_by_continent[continent] = countries
-
-            self.country_combo.config(values=["Alle Länder"] + self.countries_by_continent["Alle"],
-                                      state="readonly")
-            self.country_combo.current(0)
+            self._sorted_idx = {continent: idx[np.argsort(-self._values_arr[idx], kind='stable')]
+                                for continent, idx in self._cont_idx.items()}
 
         self.update()
 
@@ -182,7 +360,7 @@ class BarDiagram(Diagram):
         else:
             self.highlight_country = selected_country
 
-        self.update()
+        self._rehighlight()
 
     def on_continent_selected(self, event=None):
         """
@@ -193,13 +371,79 @@ class BarDiagram(Diagram):
         """
         selected_continent = self.continent_var.get()
 
-        if selected_continent in self.countries_by_continent:
-            countries = self.countries_by_continent[selected_continent]
-            self.country_combo.config(values=["Alle Länder"] + countries)
-            self.country_combo.current(0)
+        def apply_selection():
+            if selected_continent in self.countries_by_continent:
+                countries = self.countries_by_continent[selected_continent]
+                self.country_combo.config(values=["Alle Länder"] + countries)
+                self.country_combo.current(0)
 
-        self.highlight_country = None
-        self.update()
+            self.highlight_country = None
+            self._schedule_update()
+
+        self._batch_ui(apply_selection)
+
+    def _on_draw(self, event=None):
+        """
+        Sichert den Diagrammhintergrund nach jedem vollständigen Rendern
+        und zeichnet die Balken darüber (Blitting-Vorbereitung).
+        """
+        if self._bars is None:
+            return
+
+        self._bg = self.canvas.copy_from_bbox(self.ax.bbox)
+        self._draw_bar_artists()
+
+    def _draw_bar_artists(self):
+        """
+        Zeichnet die animierten Balken und Beschriftungen auf den
+        gesicherten Hintergrund und blittet den Achsenbereich.
+        """
+        for bar in self._bars:
+            self.ax.draw_artist(bar)
+        for text in self._bar_texts:
+            self.ax.draw_artist(text)
+        self.canvas.blit(self.ax.bbox)
+
+    def _rehighlight(self):
+        """
+        Färbt nur die Balken um, ohne das gesamte Diagramm neu aufzubauen.
+
+        Nutzt Blitting: Der gesicherte Hintergrund (Achsen, Titel, Ticks)
+        wird wiederhergestellt, danach werden nur die Balken neu gezeichnet.
+        Fällt auf eine vollständige Aktualisierung zurück, wenn noch kein
+        Hintergrund gesichert wurde.
+        """
+        if self._bg is None or self._bars is None:
+            self._schedule_update()
+            return
+
+        self.canvas.restore_region(self._bg)
+        for bar, country in zip(self._bars, self._bar_countries):
+            bar.set_color('orange' if self.highlight_country == country else 'skyblue')
+        self._draw_bar_artists()
+
+    def save(self, filepath):
+        """
+        Speichert das Diagramm als Bilddatei.
+
+        Deaktiviert vorübergehend den Animationsstatus der Balken, damit
+        sie beim Speichern mitgerendert werden.
+
+        Args:
+            filepath: Der Pfad, unter dem das Bild gespeichert werden soll
+        """
+        artists = list(self._bars) if self._bars is not None else []
+        artists += self._bar_texts
+
+        for artist in artists:
+            artist.set_animated(False)
+
+        try:
+            return super().save(filepath)
+        finally:
+            for artist in artists:
+                artist.set_animated(True)
+            self._bg = None
 
     def update(self):
         """
@@ -210,43 +454,44 @@ class BarDiagram(Diagram):
 
         super().update()
 
-        self.set_diagram_background('#FFF8E1')
+        self.set_diagram_background('#FFF8E1', redraw=False)
 
         selected_continent = self.continent_var.get()
 
         if selected_continent == "Alle":
-            filtered_df = self.df
             title = "Einschulungsrate auf allen Kontinenten"
         else:
-            filtered_df = self.df[self.df['Continent'] == selected_continent]
             title = f"Einschulungsrate - {selected_continent}"
 
-        self.ax.clear()
+        sorted_idx = self._sorted_idx[selected_continent]
 
-        filtered_df = filtered_df.sort_values(
-            by="Combined total net enrolment rate, primary, both sexes",
-            ascending=False
-        )
+        self.ax.clear()
 
-        countries = filtered_df['Entity'].values
-        values = filtered_df["Combined total net enrolment rate, primary, both sexes"].values
-        years = filtered_df['Year'].values
+        countries = self._entity_arr[sorted_idx]
+        values = self._values_arr[sorted_idx]
+        years = self._years_arr[sorted_idx]
 
-        if filtered_df.empty:
+        if len(sorted_idx) == 0:
+            self._bars = None
+            self._bar_texts = []
             self.ax.text(0.5, 0.5, f"Keine Daten für {selected_continent} vorhanden",
                          horizontalalignment='center', fontsize=14)
-            self.canvas.draw()
+            self.canvas.draw_idle()
             return
 
         colors = ['orange' if self.highlight_country == country else 'skyblue' for country in countries]
 
-        bars = self.ax.bar(countries, values, color=colors)
+        bars = self.ax.bar(countries, values, color=colors, animated=True)
 
-        # Add year labels below bars
-        for i, bar in enumerate(bars):
-            self.ax.text(bar.get_x() + bar.get_width() / 2, 5,
-                         f"{int(years[i])}", ha='center', va='bottom',
-                         color='black', rotation=90, fontsize=8)
+        self._bars = bars
+        self._bar_countries = countries
+        self._bg = None
+
+        # Add year labels inside bars
+        year_labels = [f"{int(year)}" for year in years]
+        year_texts = self.ax.bar_label(bars, labels=year_labels, label_type='center',
+                                       color='black', rotation=90, fontsize=8,
+                                       animated=True)
 
         self.ax.set_title(title, fontsize=14)
         self.ax.set_xlabel('Länder', fontsize=12)
@@ -254,18 +499,21 @@ class BarDiagram(Diagram):
         self.ax.set_ylim(0, 105)
 
         # Add value labels above bars
-        for bar in bars:
-            height = bar.get_height()
-            self.ax.text(bar.get_x() + bar.get_width() / 2., height + 1,
-                         f'{height:.2f}%', ha='center', va='bottom', fontsize=8)
+        value_labels = [f'{value:.2f}%' for value in values]
+        value_texts = self.ax.bar_label(bars, labels=value_labels, padding=2,
+                                        fontsize=8, animated=True)
+
+        self._bar_texts = list(year_texts) + list(value_texts)
         # rotates x-axis labels
-        plt.xticks(rotation=45, ha='right', fontsize=10)
+        self.ax.tick_params(axis='x', rotation=45, labelsize=10)
+        for label in self.ax.get_xticklabels():
+            label.set_ha('right')
 
         self.figure.tight_layout()
-        self.canvas.draw()
+        self.canvas.draw_idle()
 
 
-class ScatterPlot(Diagram):
+class ScatterPlot(_ContinentFilterMixin, Diagram):
     """
     Klasse für Streudiagramme, erbt von der Basisklasse Diagram.
     """
@@ -299,29 +547,49 @@ class ScatterPlot(Diagram):
 
         self.highlight_country = None
         self.countries_by_continent = {}
+        self._filter_cache = {}
+        self._cont_idx = {}
 
     def set_data(self, df):
         """
-        Setzt die Daten und initialisiert die Comboboxen.
+        Setzt die Daten und leert den Filter-Cache.
+
+        Erwartet, dass apply_index bereits aufgerufen wurde.
+
         Args:
             df: Der DataFrame mit den zu visualisierenden Daten
         """
+        if df is not None:
+            df = self._downcast(df)
         self.df = df
+        self._filter_cache = {}
         if df is not None:
-            continents = sorted(df['Continent'].unique())
-            self.continent_combo.config(values=["Alle"] + continents, state="readonly")
-            self.continent_combo.current(0)
-
-            self.countries_by_continent = {"Alle": sorted(df['Entity'].unique())}
-            for continent in continents:
-                countries = sorted(df[df['Continent'] == continent]['Entity'].unique())
-                self.countries_by_continent[continent] = countries
-
-            self.country_combo.config(values=["Alle Länder"] + self.countries_by_continent["Alle"],
-                                      state="readonly")
-            self.country_combo.current(0)
             self.update()
 
+    def _get_filtered(self, continent, country):
+        """
+        Liefert den nach Kontinent und Land gefilterten DataFrame und merkt
+        sich das Ergebnis für wiederholte Auswahlen.
+
+        Args:
+            continent: Der ausgewählte Kontinent oder "Alle"
+            country: Das ausgewählte Land oder "Alle Länder"
+        """
+        key = (continent, country)
+        if key in self._filter_cache:
+            return self._filter_cache[key]
+
+        if continent == "Alle":
+            filtered_df = self.df
+        else:
+            filtered_df = self.df.iloc[self._cont_idx[continent]]
+
+        if country != "Alle Länder":
+            filtered_df = filtered_df[filtered_df['Entity'] == country]
+
+        self._filter_cache[key] = filtered_df
+        return filtered_df
+
     def update(self):
         """
         Aktualisiert das Streudiagramm basierend auf den ausgewählten Filtern.
@@ -331,53 +599,49 @@ class ScatterPlot(Diagram):
 
         super().update()
 
-        self.set_diagram_background('#FFF8E1')
-        self.canvas.draw()
+        self.set_diagram_background('#FFF8E1', redraw=False)
 
         selected_continent = self.continent_var.get()
         selected_country = self.country_var.get()
 
-        if selected_continent == "Alle":
-            filtered_df = self.df
+        if selected_country != "Alle Länder":
+            title = f"Einschulungsrate im Zeitverlauf - {selected_country}"
+        elif selected_continent == "Alle":
             title = "Einschulungsrate im Zeitverlauf - Alle Kontinente"
         else:
-            filtered_df = self.df[self.df['Continent'] == selected_continent]
             title = f"Einschulungsrate im Zeitverlauf - {selected_continent}"
 
-        if selected_country != "Alle Länder":
-            filtered_df = filtered_df[filtered_df['Entity'] == selected_country]
-            title = f"Einschulungsrate im Zeitverlauf - {selected_country}"
+        filtered_df = self._get_filtered(selected_continent, selected_country)
 
         self.ax.clear()
 
         if filtered_df.empty:
             self.ax.text(0.5, 0.5, f"Keine Daten für die ausgewählten Filter vorhanden",
                          horizontalalignment='center', fontsize=14)
-            self.canvas.draw()
+            self.canvas.draw_idle()
             return
 
         if selected_country != "Alle Länder":
             years = filtered_df['Year'].values
-            values = filtered_df["Combined total net enrolment rate, primary, both sexes"].values
+            values = filtered_df[RATE_COL].values
             self.ax.plot(years, values, 'o-', color='blue', markersize=6)
 
             for x, y in zip(years, values):
                 self.ax.text(x, y + 1, f"{y:.1f}%", ha='center', va='bottom', fontsize=8)
 
         else:
-            countries = filtered_df['Entity'].unique()
-            colors = plt.cm.tab10(np.linspace(0, 1, len(countries)))
-
-            for i, country in enumerate(countries):
-                country_data = filtered_df[filtered_df['Entity'] == country]
-                years = country_data['Year'].values
-                values = country_data["Combined total net enrolment rate, primary, both sexes"].values
-
-                if len(years) > 0:
-                    self.ax.scatter(years, values, color=colors[i], alpha=0.7, label=country)
-
-            if len(countries) > 1 and len(countries) <= 15:
-                self.ax.legend(loc='upper center', bbox_to_anchor=(0.5, -0.15),
+            codes, countries = pd.factorize(filtered_df['Entity'].to_numpy())
+            colors = _tab10(len(countries))
+
+            self.ax.scatter(filtered_df['Year'].values, filtered_df[RATE_COL].values,
+                            c=colors[codes], alpha=0.7)
+
+            if 1 < len(countries) <= 15:
+                handles = [Line2D([], [], marker='o', linestyle='', color=colors[i],
+                                  label=countries[i])
+                           for i in range(len(countries))]
+                self.ax.legend(handles=handles, loc='upper center',
+                               bbox_to_anchor=(0.5, -0.15),
                                ncol=min(5, len(countries)), fontsize=8)
 
         self.ax.set_title(title, fontsize=14)
@@ -389,7 +653,7 @@ class ScatterPlot(Diagram):
         self.ax.xaxis.set_major_locator(plt.MaxNLocator(integer=True))
 
         self.figure.tight_layout()
-        self.canvas.draw()
+        self.canvas.draw_idle()
 
     def on_continent_selected(self, event=None):
         """
@@ -400,13 +664,16 @@ class ScatterPlot(Diagram):
         """
         selected_continent = self.continent_var.get()
 
-        if selected_continent in self.countries_by_continent:
-            countries = self.countries_by_continent[selected_continent]
-            self.country_combo.config(values=["Alle Länder"] + countries)
-            self.country_combo.current(0)
+        def apply_selection():
+            if selected_continent in self.countries_by_continent:
+                countries = self.countries_by_continent[selected_continent]
+                self.country_combo.config(values=["Alle Länder"] + countries)
+                self.country_combo.current(0)
 
-        self.highlight_country = None
-        self.update()
+            self.highlight_country = None
+            self._schedule_update()
+
+        self._batch_ui(apply_selection)
 
     def on_country_selected(self, event=None):
         """
@@ -422,7 +689,7 @@ class ScatterPlot(Diagram):
         else:
             self.highlight_country = selected_country
 
-        self.update()
+        self._schedule_update()
 
 
 class PieDiagram(Diagram):
@@ -502,6 +769,57 @@ class PieDiagram(Diagram):
 
         self.range_frame.pack_forget()
 
+        self._continent_avg = None
+        self._year_counts = None
+        self._color_cache = {}
+
+    def filter_state(self):
+        """
+        Liefert den ausgewählten Diagrammtyp samt Bereichsparametern als Tupel.
+        """
+        return (self.chart_type_var.get(), self.min_var.get(), self.step_var.get())
+
+    def _mode_colors(self, mode, n):
+        """
+        Liefert die Farbpalette für einen Diagrammmodus und merkt sie sich,
+        damit die Colormap nicht bei jedem Moduswechsel neu abgetastet wird.
+
+        Args:
+            mode: Einer der Modi 'continent', 'range' oder 'year'
+            n: Anzahl der benötigten Farben
+        """
+        key = (mode, n)
+        if key not in self._color_cache:
+            if mode == 'continent':
+                colors = plt.cm.Paired(np.arange(n) / n)
+            elif mode == 'range':
+                colors = plt.cm.Greens(np.linspace(0.3, 0.9, n))
+            else:
+                colors = plt.cm.viridis(np.linspace(0, 0.9, n))
+            self._color_cache[key] = colors
+        return self._color_cache[key]
+
+    def set_data(self, df):
+        """
+        Setzt die Daten und berechnet die wiederverwendeten Aggregate vor.
+
+        Durchschnittsraten pro Kontinent und Datensätze pro Jahr ändern
+        sich nur beim Laden einer neuen CSV-Datei, nicht bei Tab- oder
+        Diagrammtypwechseln.
+
+        Args:
+            df: Der DataFrame mit den zu visualisierenden Daten
+        """
+        if df is not None:
+            df = self._downcast(df)
+            self._continent_avg = (df.groupby('Continent', observed=True)[RATE_COL]
+                                   .mean().sort_values(ascending=False))
+            self._year_counts = df['Year'].value_counts().sort_index()
+            self._color_cache = {}
+
+        self.df = df
+        self.update()
+
     def on_chart_type_selected(self, event=None):
         """
         Wird aufgerufen, wenn ein Diagrammtyp ausgewählt wurde.
@@ -516,7 +834,7 @@ class PieDiagram(Diagram):
         else:
             self.range_frame.pack_forget()
 
-        self.update()
+        self._schedule_update()
 
     def update(self):
         """
@@ -527,9 +845,7 @@ class PieDiagram(Diagram):
 
         super().update()
 
-        self.set_diagram_background('#FFF8E1')
-
-        self.canvas.draw()
+        self.set_diagram_background('#FFF8E1', redraw=False)
 
         self.ax.clear()
 
@@ -542,21 +858,19 @@ class PieDiagram(Diagram):
         elif chart_type == "Verteilung der Daten nach Jahr":
             self.create_year_distribution_chart()
 
-        self.canvas.draw()
+        self.canvas.draw_idle()
 
     def create_continent_avg_chart(self):
         """
         Erstellt ein Kreisdiagramm, das die durchschnittliche Einschulungsrate
         nach Kontinenten darstellt.
         """
-        continent_avg = self.df.groupby('Continent')['Combined total net enrolment rate, primary, both sexes'].mean()
-
-        continent_avg = continent_avg.sort_values(ascending=False)
+        continent_avg = self._continent_avg
 
         values = continent_avg.values
         labels = continent_avg.index
 
-        colors = plt.cm.Paired(np.arange(len(values)) / len(values))
+        colors = self._mode_colors('continent', len(values))
         explode = [0.1 if i == 0 else 0 for i in range(len(values))]
 
         wedges, texts, autotexts = self.ax.pie(
@@ -601,26 +915,18 @@ class PieDiagram(Diagram):
 
             range_labels = [f"{bins[i]:.0f}%-{bins[i + 1]:.0f}%" for i in range(len(bins) - 1)]
 
-            enrolment_col = 'Combined total net enrolment rate, primary, both sexes'
-            binned_data = pd.cut(
-                self.df[enrolment_col],
-                bins=bins,
-                labels=range_labels,
-                include_lowest=True
-            )
+            counts, _ = np.histogram(self.df[RATE_COL].values, bins=bins)
 
-            range_counts = binned_data.value_counts().sort_index()
+            mask = counts > 0
+            values = counts[mask]
+            labels = [label for label, keep in zip(range_labels, mask) if keep]
 
-            if len(range_counts) == 0:
+            if len(values) == 0:
                 self.ax.text(0.5, 0.5, "Keine Daten in den angegebenen Bereichen",
                              ha='center', va='center', fontsize=12)
                 return
 
-            values = range_counts.values
-            labels = range_counts.index
-
-            cmap = plt.cm.Greens
-            colors = cmap(np.linspace(0.3, 0.9, len(values)))
+            colors = self._mode_colors('range', len(values))
 
             wedges, texts, autotexts = self.ax.pie(
                 values,
@@ -649,12 +955,12 @@ class PieDiagram(Diagram):
         """
         Erstellt ein Kreisdiagramm, das die Verteilung der Daten nach Jahren darstellt.
         """
-        year_counts = self.df['Year'].value_counts().sort_index()
+        year_counts = self._year_counts
 
         values = year_counts.values
         labels = [str(int(year)) for year in year_counts.index]
 
-        colors = plt.cm.viridis(np.linspace(0, 0.9, len(values)))
+        colors = self._mode_colors('year', len(values))
 
         wedges, texts, autotexts = self.ax.pie(
             values,
@@ -700,6 +1006,8 @@ class PlotterDiagram(Diagram):
                                     text="Separate Diagramme für jeden Kontinent werden angezeigt.")
         self.info_label.pack(side=tk.LEFT, padx=10)
 
+        self._n_continents = None
+
     def update(self):
         """
         Aktualisiert die Diagramme für Kontinente basierend auf den Daten.
@@ -709,33 +1017,27 @@ class PlotterDiagram(Diagram):
 
         super().update()
 
-        self.set_diagram_background('#FFF8E1')
-
-        plt.close(self.figure)
-        self.ax.clear()
-
-        ents = self.df['Entity'].values
-        conts = self.df['Continent'].values
-        years = self.df['Year'].values
-        rates = self.df['Combined total net enrolment rate, primary, both sexes'].values
+        continent_groups = self.df.groupby('Continent', sort=True)
 
-        unique_continents = sorted(list(set(conts)))
+        unique_continents = len(continent_groups)
 
-        plt.close(self.figure)
-
-        self.figure, axes = plt.subplots(len(unique_continents), 1,
-                                         figsize=(10, 4 * len(unique_continents)))
-
-        if len(unique_continents) == 1:
-            axes = [axes]
+        if unique_continents != self._n_continents:
+            self.figure.clf()
+            self.figure.set_size_inches(10, 4 * unique_continents)
+            axes = self.figure.subplots(unique_continents, 1)
+            axes = [axes] if unique_continents == 1 else list(axes)
+            self._n_continents = unique_continents
+        else:
+            axes = self.figure.axes
+            for ax in axes:
+                ax.clear()
 
-        for i, continent in enumerate(unique_continents):
-            continent_indices = [j for j, c in enumerate(conts) if c == continent]
-            continent_years = [years[j] for j in continent_indices]
-            continent_rates = [rates[j] for j in continent_indices]
-            continent_ents = [ents[j] for j in continent_indices]
+        self.ax = axes[0]
+        self.set_diagram_background('#FFF8E1', redraw=False)
 
-            unique_entities = sorted(list(set(continent_ents)))
+        for i, (continent, continent_df) in enumerate(continent_groups):
+            entity_groups = continent_df.groupby('Entity', sort=True)
+            unique_entities = len(entity_groups)
 
             axes[i].grid(True, which="both")
             axes[i].set_title(f"Einschulung - {continent}")
@@ -744,38 +1046,29 @@ class PlotterDiagram(Diagram):
             axes[i].set_xlim(1820, 2025)
             axes[i].set_ylim(0, 100)
 
-            colors = plt.cm.tab20(range(len(unique_entities)))
+            colors = _tab20(unique_entities)
 
-            for j, entity in enumerate(unique_entities):
-                entity_indices = [k for k, e in enumerate(continent_ents) if e == entity]
-                entity_years = [continent_years[k] for k in entity_indices]
-                entity_rates = [continent_rates[k] for k in entity_indices]
+            for j, (entity, entity_df) in enumerate(entity_groups):
+                entity_years = entity_df['Year'].values
+                entity_rates = entity_df[RATE_COL].values
 
                 axes[i].scatter(entity_years, entity_rates, label=entity,
                                 color=colors[j % len(colors)])
 
                 if len(entity_years) > 1:
-                    entity_data = sorted(zip(entity_years, entity_rates))
-                    sorted_years, sorted_rates = zip(*entity_data)
-                    axes[i].plot(sorted_years, sorted_rates,
+                    order = np.argsort(entity_years)
+                    axes[i].plot(entity_years[order], entity_rates[order],
                                  color=colors[j % len(colors)], alpha=0.7)
 
-            if len(unique_entities) <= 15:
+            if unique_entities <= 15:
                 axes[i].legend(loc='best', fontsize='small')
             else:
-                axes[i].text(0.02, 0.98, f"{len(unique_entities)} Länder",
+                axes[i].text(0.02, 0.98, f"{unique_entities} Länder",
                              transform=axes[i].transAxes, fontsize=10,
                              verticalalignment='top')
 
         self.figure.tight_layout()
-
-        if hasattr(self, 'canvas_widget'):
-            self.canvas_widget.pack_forget()
-
-        self.canvas = FigureCanvasTkAgg(self.figure, master=self.parent)
-        self.canvas_widget = self.canvas.get_tk_widget()
-        self.canvas_widget.pack(fill=tk.BOTH, expand=True)
-        self.show()
+        self.canvas.draw_idle()
 
 
 class EinschulungsApp:
@@ -808,6 +1101,10 @@ class EinschulungsApp:
 
         self.df = None
         self.file_path = None
+        self._tab_cache = {}
+        self._data_version = 0
+        self._filter_index = None
+        self._io_pool = concurrent.futures.ThreadPoolExecutor(max_workers=2)
         self.create_menu()
         self.create_notebook()
 
@@ -860,48 +1157,70 @@ class EinschulungsApp:
         Laden Sie eine CSV-Datei mit Einschulungsdaten, um mit der Analyse zu beginnen. Die Visualisierung wird automatisch aktualisiert, wenn Sie die Filter anpassen.
         """
 
-        overview_text_scroll = tk.Scrollbar(overview_frame)
-        overview_text_scroll.pack(side=tk.RIGHT, fill=tk.Y)
-
         cream_color = "#FFF8E1"
-        overview_text_widget = tk.Text(overview_frame, wrap=tk.WORD, height=30,
-                                       font=("Arial", 10),
-                                       yscrollcommand=overview_text_scroll.set,
-                                       background=cream_color,
-                                       highlightbackground=cream_color,
-                                       borderwidth=0)
+        overview_label = ttk.Label(overview_frame, text=overview_text,
+                                   wraplength=900, justify='left',
+                                   background=cream_color, font=("Arial", 10))
+        overview_label.pack(fill=tk.BOTH, expand=True, padx=8, pady=8)
 
-        overview_text_widget.insert(tk.END, overview_text)
-        overview_text_widget.config(state=tk.DISABLED)
-        overview_text_widget.pack(fill=tk.X, expand=True)
-        overview_text_scroll.config(command=overview_text_widget.yview)
+        def reflow_overview(event):
+            overview_label.configure(wraplength=max(event.width - 16, 200))
 
-        self.bar_diagram = BarDiagram(self.tab2, self)
+        overview_frame.bind("<Configure>", reflow_overview)
 
-        self.scatter_plot = ScatterPlot(self.tab3, self)
+        # Diagramme werden erst beim ersten Besuch ihres Tabs erstellt;
+        # so entstehen beim Programmstart keine matplotlib-Figuren.
+        self._diagram_factories = {
+            1: lambda: BarDiagram(self.tab2, self),
+            2: lambda: ScatterPlot(self.tab3, self),
+            3: lambda: PieDiagram(self.tab4, self),
+            4: lambda: PlotterDiagram(self.tab5, self),
+        }
+        self._diagrams = {}
 
-        self.pie_diagram = PieDiagram(self.tab4, self)
+    def _get_diagram(self, index):
+        """
+        Liefert das Diagramm für einen Tab und erstellt es bei Bedarf.
 
-        self.plotter_diagram = PlotterDiagram(self.tab5, self)
+        Neu erstellte Diagramme erhalten sofort die bereits geladenen Daten
+        und Filterstrukturen.
+
+        Args:
+            index: Der Index des Tabs im Notebook
+        """
+        if index not in self._diagram_factories:
+            return None
+
+        if index not in self._diagrams:
+            diagram = self._diagram_factories[index]()
+            self._diagrams[index] = diagram
+
+            if self.df is not None:
+                diagram.apply_index(*self._filter_index)
+                diagram.set_data(self.df)
+
+        return self._diagrams[index]
 
     def on_tab_changed(self, event):
         """
         Wird aufgerufen, wenn der Benutzer zwischen Tabs wechselt.
+
+        Aktualisiert ein Diagramm nur, wenn sich seit der letzten Anzeige
+        die Daten oder der Filterzustand geändert haben; reine Tab-Wechsel
+        kosten dann nur einen Dictionary-Lookup.
         """
-        current_tab = self.notebook.select()
-        current_tab_index = self.notebook.index(current_tab)
+        current_tab_index = event.widget.index('current')
 
-        if self.df is None:
+        diagram = self._get_diagram(current_tab_index)
+        if diagram is None or self.df is None:
+            return
+
+        key = (current_tab_index, self._data_version, diagram.filter_state())
+        if key in self._tab_cache:
             return
 
-        if current_tab_index == 1:
-            self.bar_diagram.update()
-        elif current_tab_index == 2:
-            self.scatter_plot.update()
-        elif current_tab_index == 3:
-            self.pie_diagram.update()
-        elif current_tab_index == 4:
-            self.plotter_diagram.update()
+        diagram.update()
+        self._tab_cache[key] = True
 
     def create_menu(self):
         """
@@ -916,7 +1235,7 @@ class EinschulungsApp:
         self.menubar.add_cascade(label="Datei", menu=self.file_menu)
         self.file_menu.add_command(label="CSV-Datei öffnen", command=self.load_csv_file)
         self.file_menu.add_command(label="CSV-Datei speichern", command=self.save_csv_file)
-        self.file_menu.add_command(label="In JSON konvertieren", command=self.convert_to_json)
+        self.file_menu.add_command(label="In JSON-Lines konvertieren", command=self.convert_to_json)
         self.file_menu.add_separator()
         self.file_menu.add_command(label="Diagramm als Bild speichern", command=self.save_chart_as_image)
         self.file_menu.add_separator()
@@ -962,6 +1281,10 @@ class EinschulungsApp:
         """
         Lädt eine CSV-Datei über einen Dateiauswahl-Dialog und verarbeitet
         die Daten für die Anzeige.
+
+        Das Parsen läuft in einem Hintergrund-Thread, damit die Oberfläche
+        auch bei großen Dateien bedienbar bleibt; währenddessen zeigt ein
+        kleines Fenster einen unbestimmten Fortschrittsbalken an.
         """
         file_path = filedialog.askopenfilename(
             title="CSV-Datei auswählen",
@@ -971,43 +1294,155 @@ class EinschulungsApp:
         if not file_path:
             return
 
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                reader = csv.reader(f)
-                headers = next(reader)
-                cleaned_headers = [h.strip('"\' ') for h in headers]
+        progress_window = self._show_load_progress(file_path)
 
-            df = pd.read_csv(file_path, encoding='utf-8')
+        future = self._io_pool.submit(self._parse_csv, file_path)
+        future.add_done_callback(
+            lambda fut: self.root.after(0, self._on_csv_loaded,
+                                        fut, file_path, progress_window))
 
-            if 'Entity' not in df.columns and 'Entity' in cleaned_headers:
-                rename_dict = {col: clean for col, clean in zip(df.columns, cleaned_headers)}
-                df = df.rename(columns=rename_dict)
+    def _show_load_progress(self, file_path):
+        """
+        Zeigt ein kleines Fenster mit Fortschrittsbalken während des Ladens.
 
-            required_columns = ['Entity', 'Continent', 'Year',
-                                'Combined total net enrolment rate, primary, both sexes']
+        Args:
+            file_path: Der Pfad der Datei, die gerade geladen wird
+        """
+        window = tk.Toplevel(self.root)
+        window.title("Laden...")
+        window.transient(self.root)
+        window.resizable(False, False)
+
+        ttk.Label(window,
+                  text=f"Lade {os.path.basename(file_path)} ...").pack(padx=20, pady=(15, 5))
+
+        bar = ttk.Progressbar(window, mode='indeterminate', length=250)
+        bar.pack(padx=20, pady=(0, 15))
+        bar.start(10)
+
+        return window
+
+    def _parse_csv(self, file_path):
+        """
+        Liest und prüft eine CSV-Datei; läuft im Hintergrund-Thread.
+
+        Args:
+            file_path: Der Pfad der zu ladenden Datei
 
-            missing_cols = [col for col in required_columns if col not in df.columns]
+        Returns:
+            Tupel (df, fehlermeldung); genau eines von beiden ist None.
+        """
+        try:
+            read_opts = pacsv.ReadOptions(use_threads=True, block_size=1 << 20)
+            column_types = {
+                'Entity': pa.string(),
+                'Continent': pa.string(),
+                'Year': pa.int16(),
+                RATE_COL: pa.float32(),
+            }
+
+            try:
+                # Projektion schon beim Parsen: Zusatzspalten breiter
+                # Dateien werden gar nicht erst konvertiert.
+                convert_opts = pacsv.ConvertOptions(column_types=column_types,
+                                                    include_columns=REQUIRED_COLS)
+                table = pacsv.read_csv(file_path, read_options=read_opts,
+                                       convert_options=convert_opts)
+            except pa.ArrowKeyError:
+                # Spalten fehlen oder tragen Anführungszeichen im Header:
+                # einmal ungefiltert lesen, um sauber diagnostizieren zu
+                # können, welche Spalten tatsächlich vorhanden sind.
+                convert_opts = pacsv.ConvertOptions(column_types=column_types)
+                table = pacsv.read_csv(file_path, read_options=read_opts,
+                                       convert_options=convert_opts)
+
+            cleaned_names = [col.strip('"\' ') for col in table.column_names]
+            if cleaned_names != table.column_names:
+                table = table.rename_columns(cleaned_names)
+
+            # column_names ist eine Liste; einmal in ein frozenset umwandeln
+            # statt pro Spalte linear zu suchen.
+            colset = frozenset(table.column_names)
+            missing_cols = [col for col in REQUIRED_COLS if col not in colset]
             if missing_cols:
-                messagebox.showerror(
-                    "Fehler",
+                return None, (
                     f"Die Datei hat ein ungültiges Format. Folgende Spalten fehlen: {', '.join(missing_cols)}\n\n"
-                    f"Vorhandene Spalten: {', '.join(df.columns)}"
+                    f"Vorhandene Spalten: {', '.join(table.column_names)}"
                 )
-                return
 
-            self.df = df
-            self.file_path = file_path
+            df = table.select(REQUIRED_COLS).to_pandas()
+            # Entity/Continent werden kategorisch: Gruppierungen und Filter
+            # laufen danach auf Integer-Codes statt auf Python-Strings.
+            df = df.astype(DTYPES)
 
-            if self.df is not None:
-                self.bar_diagram.set_data(self.df)
-                self.scatter_plot.set_data(self.df)
-                self.pie_diagram.set_data(self.df)
-                self.plotter_diagram.set_data(self.df)
+            return df, None
 
         except Exception as e:
-            messagebox.showerror("Fehler", f"Fehler beim Laden der CSV-Datei:\n{str(e)}")
-            import traceback
-            traceback.print_exc()
+            return None, f"Fehler beim Laden der CSV-Datei:\n{str(e)}"
+
+    def _on_csv_loaded(self, future, file_path, progress_window):
+        """
+        Übernimmt das Ergebnis des Hintergrund-Parsens im Hauptthread.
+
+        Args:
+            future: Das Future mit dem Ergebnis von _parse_csv
+            file_path: Der Pfad der geladenen Datei
+            progress_window: Das zu schließende Fortschrittsfenster
+        """
+        progress_window.destroy()
+
+        df, error = future.result()
+        if error is not None:
+            messagebox.showerror("Fehler", error)
+            return
+
+        self.df = df
+        self.file_path = file_path
+        self._data_version += 1
+        self._tab_cache = {}
+        self._filter_index = self._build_filter_index(self.df)
+
+        for diagram in self._diagrams.values():
+            diagram.apply_index(*self._filter_index)
+            diagram.set_data(self.df)
+
+    def _build_filter_index(self, df):
+        """
+        Berechnet die von allen Diagrammen gemeinsam genutzten
+        Filterstrukturen einmalig pro geladener CSV-Datei.
+
+        Args:
+            df: Der geladene DataFrame
+
+        Returns:
+            Tupel aus (continents, countries_by_continent, cont_idx)
+        """
+        continents = sorted(df['Continent'].unique())
+
+        grouped = df.groupby('Continent', sort=False)['Entity'].unique().to_dict()
+        countries_by_continent = {continent: sorted(countries.tolist())
+                                  for continent, countries in grouped.items()}
+        countries_by_continent["Alle"] = sorted(df['Entity'].unique())
+
+        cont_idx = {continent: np.asarray(idx, dtype=np.int32)
+                    for continent, idx in df.groupby('Continent', sort=False,
+                                                     observed=True).indices.items()}
+        cont_idx["Alle"] = np.arange(len(df), dtype=np.int32)
+
+        return continents, countries_by_continent, cont_idx
+
+    def view_for_continent(self, continent):
+        """
+        Liefert die Zeilen des geladenen DataFrames für einen Kontinent.
+
+        Args:
+            continent: Der Kontinent oder "Alle" für alle Zeilen
+        """
+        if self.df is None or self._filter_index is None:
+            return None
+
+        cont_idx = self._filter_index[2]
+        return self.df.iloc[cont_idx.get(continent, cont_idx["Alle"])]
 
     def save_csv_file(self):
         """
@@ -1034,7 +1469,9 @@ class EinschulungsApp:
             return
 
         try:
-            self.df.to_csv(csv_path, index=False, encoding='utf-8')
+            table = pa.Table.from_pandas(self.df, preserve_index=False)
+            pacsv.write_csv(table, csv_path,
+                            write_options=pacsv.WriteOptions(include_header=True))
             messagebox.showinfo("Erfolg", f"Datei erfolgreich gespeichert:\n{csv_path}")
 
         except Exception as e:
@@ -1048,15 +1485,10 @@ class EinschulungsApp:
             messagebox.showwarning("Warnung", "Keine Daten zum Speichern vorhanden.")
             return
 
-        current_tab_index = self.notebook.index(self.notebook.select())
+        current_tab_index = self.notebook.index('current')
 
-        if current_tab_index == 1:
-            diagram = self.bar_diagram
-        elif current_tab_index == 2:
-            diagram = self.scatter_plot
-        elif current_tab_index == 3:
-            diagram = self.pie_diagram
-        else:
+        diagram = self._diagrams.get(current_tab_index) if current_tab_index in (1, 2, 3) else None
+        if diagram is None:
             messagebox.showwarning("Warnung", "In diesem Tab gibt es kein Diagramm zum Speichern.")
             return
 
@@ -1080,17 +1512,30 @@ class EinschulungsApp:
         if not image_path:
             return
 
-        success = diagram.save(image_path)
+        # Die Rasterung/Kodierung läuft im Hintergrund, damit die Oberfläche
+        # während des Speicherns bedienbar bleibt.
+        future = self._io_pool.submit(diagram.save, image_path)
 
-        if success:
-            messagebox.showinfo("Erfolg", f"Diagramm erfolgreich gespeichert als:\n{image_path}")
-        else:
-            messagebox.showerror("Fehler", "Fehler beim Speichern des Diagramms.")
+        def on_saved(fut):
+            try:
+                success = fut.result()
+            except Exception:
+                success = False
+
+            if success:
+                self.root.after(0, lambda: messagebox.showinfo(
+                    "Erfolg", f"Diagramm erfolgreich gespeichert als:\n{image_path}"))
+            else:
+                self.root.after(0, lambda: messagebox.showerror(
+                    "Fehler", "Fehler beim Speichern des Diagramms."))
+
+        future.add_done_callback(on_saved)
 
     def convert_to_json(self):
         """
-        Konvertiert die geladenen CSV-Daten in das JSON-Format und
-        speichert sie über einen Dateiauswahl-Dialog.
+        Konvertiert die geladenen CSV-Daten in das JSON-Lines-Format
+        (ein JSON-Objekt pro Zeile) und speichert sie über einen
+        Dateiauswahl-Dialog.
         """
         if self.df is None or self.file_path is None:
             messagebox.showwarning("Warnung", "Keine Daten zum Konvertieren vorhanden.")
@@ -1108,10 +1553,13 @@ class EinschulungsApp:
             return
 
         try:
-            json_str = self.df.to_json(orient="records", indent=4)
+            columns = self.df.columns.tolist()
 
-            with open(json_path, 'w', encoding='utf-8') as f:
-                f.write(json_str)
+            with open(json_path, 'wb') as f:
+                for row in self.df.itertuples(index=False, name=None):
+                    f.write(orjson.dumps(dict(zip(columns, row)),
+                                         option=orjson.OPT_SERIALIZE_NUMPY))
+                    f.write(b'\n')
 
             messagebox.showinfo("Erfolg", f"Datei erfolgreich als JSON gespeichert:\n{json_path}")
 